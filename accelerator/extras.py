@@ -85,11 +85,11 @@ def job_post(jobid):
 		raise Exception("Don't know how to load post.json version %d (in %s)" % (d.version, jobid,))
 	return d
 
-def pickle_save(variable, filename='result.pickle', sliceno=None, temp=None, _hidden=False):
+# use protocol version 2 by default so python2 can read the pickles too.
+def pickle_save(variable, filename='result.pickle', sliceno=None, temp=None, _hidden=False, _protocol=2):
 	filename = _fn(filename, None, sliceno)
 	with FileWriteMove(filename, temp, _hidden=_hidden) as fh:
-		# use protocol version 2 so python2 can read the pickles too.
-		pickle.dump(variable, fh, 2)
+		pickle.dump(variable, fh, _protocol)
 
 # default to encoding='bytes' because datetime.* (and probably other types
 # too) saved in python 2 fail to unpickle in python 3 otherwise. (Official
@@ -104,6 +104,13 @@ def pickle_load(filename='result.pickle', jobid=None, sliceno=None, encoding='by
 				return pickle.load(fh)
 
 
+# json.dumps builds a new JSONEncoder for every call with non-default
+# arguments, so keep one for each sort_keys value.
+_json_encoders = {
+	True: json.JSONEncoder(indent=4, sort_keys=True),
+	False: json.JSONEncoder(indent=4, sort_keys=False),
+}
+
 def json_encode(variable, sort_keys=True, as_str=False):
 	"""Return variable serialised as json bytes (or str with as_str=True).
 
@@ -127,7 +134,7 @@ def json_encode(variable, sort_keys=True, as_str=False):
 		else:
 			return e
 	variable = typefix(variable)
-	res = json.dumps(variable, indent=4, sort_keys=sort_keys)
+	res = _json_encoders[bool(sort_keys)].encode(variable)
 	if PY3 and not as_str:
 		res = res.encode('ascii')
 	return res
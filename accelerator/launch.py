@@ -113,8 +113,10 @@ def call_analysis(analysis_func, sliceno_, delayed_start, q, preserve_result, pa
 						return dict(d)
 				else:
 					return d
+			# These are only read back by synthesis in this same process
+			# tree, so there is no need to stay python2 compatible.
 			def save(item, name):
-				blob.save(fixup(item), name, sliceno=sliceno_, temp=True)
+				blob.save(fixup(item), name, sliceno=sliceno_, temp=True, _protocol=pickle.HIGHEST_PROTOCOL)
 			if isinstance(res, tuple):
 				if sliceno_ == 0:
 					blob.save(len(res), "Analysis.tuple", temp=True)
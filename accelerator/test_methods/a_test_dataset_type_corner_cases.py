@@ -60,13 +60,13 @@ def verify(name, types, bytes_data, want, default=no_default, want_fail=False, a
 		_verify(dsname, types, data, coltype, want, default, want_fail, kw)
 
 def _verify(name, types, data, coltype, want, default, want_fail, kw):
-	if callable(want):
+	custom_check = callable(want)
+	if custom_check:
 		check = want
 	else:
+		want_per_type = not isinstance(want, list)
 		def check(got, fromstr, filtered=False):
-			want1 = want if isinstance(want, list) else want[typ]
-			if filtered:
-				want1 = want1[::2]
+			want1 = want_typ[::2] if filtered else want_typ
 			assert got == want1, 'Expected %r, got %r from %s.' % (want1, got, fromstr,)
 	dw = DatasetWriter(name=name, columns={'data': coltype, 'extra': 'bytes'})
 	dw.set_slice(0)
@@ -76,6 +76,8 @@ def _verify(name, types, data, coltype, want, default, want_fail, kw):
 		dw.set_slice(sliceno)
 	bytes_ds = dw.finish()
 	for typ in types:
+		if not custom_check:
+			want_typ = want[typ] if want_per_type else want
 		opts = dict(column2type=dict(data=typ))
 		opts.update(kw)
 		if default is not no_default:
@@ -90,7 +92,7 @@ def _verify(name, types, data, coltype, want, default, want_fail, kw):
 		typed_ds = Dataset(jid)
 		got = list(typed_ds.iterate(0, 'data'))
 		check(got, '%s (typed as %s from %r)' % (typed_ds, typ, bytes_ds,))
-		if 'filter_bad' not in opts and not callable(want):
+		if 'filter_bad' not in opts and not custom_check:
 			opts['filter_bad'] = True
 			opts['column2type']['extra'] = 'int32_10'
 			jid = subjobs.build('dataset_type', datasets=dict(source=bytes_ds), options=opts)
@@ -81,14 +81,14 @@ def verify(slices, data, source, previous=None, **options):
 	hl = options["hashlabel"]
 	h = typed_writer(columns[hl][0]).hash
 	ds = Dataset(jid)
-	good = {row[hl]: row for row in data}
 	names = list(source.columns)
+	hl_ix = names.index(hl)
+	good = {row[hl]: tuple(row[n] for n in names) for row in data}
 	for slice in range(slices):
 		for row in ds.iterate_chain(slice, names):
-			row = dict(zip(names, row))
-			assert h(row[hl]) % slices == slice, "row %r is incorrectly in slice %d in %s" % (row, slice, ds)
-			want = good[row[hl]]
-			assert row == want, '%s (rehashed from %s) did not contain the right data for "%s".\nWanted\n%r\ngot\n%r' % (ds, source, hl, want, row)
+			assert h(row[hl_ix]) % slices == slice, "row %r is incorrectly in slice %d in %s" % (dict(zip(names, row)), slice, ds)
+			want = good[row[hl_ix]]
+			assert row == want, '%s (rehashed from %s) did not contain the right data for "%s".\nWanted\n%r\ngot\n%r' % (ds, source, hl, dict(zip(names, want)), dict(zip(names, row)))
 	return ds
 
 def synthesis(params):
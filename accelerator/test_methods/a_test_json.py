@@ -110,15 +110,11 @@ def synthesis():
 
 	# 720 permutations might be a bit much, but at least it's unlikely to
 	# miss ordering problems.
-	sorted_s = None
+	def fmt(pairs):
+		return ("{" + ",".join('"%s": %s' % kv for kv in pairs) + "}").encode("ascii")
+	sorted_s = fmt(zip("abcdef", range(6)))
 	for ix, pairs in enumerate(permutations(zip("abcdef", range(6)))):
-		d = OrderedDict()
-		s = "{"
-		for k, v in pairs:
-			d[k] = v
-			s += '"%s": %s,' % (k, v)
-		s = (s[:-1] + "}").encode("ascii")
-		if not sorted_s:
-			sorted_s = s
+		d = OrderedDict(pairs)
+		s = fmt(pairs)
 		test("ordered%d.json" % (ix,), d, d, s, sort_keys=False)
 		test("sorted%d.json" % (ix,), d, d, sorted_s, sort_keys=True)
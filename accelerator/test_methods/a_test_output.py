@@ -64,7 +64,7 @@ def test(params, p=False, a=False, s=False):
 		with open(d +  part, 'r') as fh:
 			got = fh.read().replace('\r\n', '\n')
 		want = prefix + '\n' + data + '\n'
-		assert got == prefix + '\n' + data + '\n', "%s produced %r in %s, expected %r" % (jid, got, part, want,)
+		assert got == want, "%s produced %r in %s, expected %r" % (jid, got, part, want,)
 		assert output == got, 'job.output disagrees with manual file reading for %s in %s. %r != %r' % (part, jid, output, got,)
 		all.append(got)
 	if p:
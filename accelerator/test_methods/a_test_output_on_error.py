@@ -41,13 +41,13 @@ def synthesis():
 			job = e.job
 		else:
 			raise Exception("test_output_on_error with inner=True didn't fail")
+		want_start = '\n'.join(lines) + '\n'
+		want_line = 'Exception: this is an exception, but nothing went wrong'
 		# give the iowrapper some time to finish
 		for attempt in range(25):
-			got_lines = job.output().split('\n')
-			if got_lines[:len(lines)] == lines:
-				for line in got_lines:
-					if line == 'Exception: this is an exception, but nothing went wrong':
-						return
+			got = job.output()
+			if got.startswith(want_start) and want_line in got.split('\n'):
+				return
 			# not yet, wait a little (total of 30s)
 			if attempt > 1:
 				print('Output from %s has not appeared yet, waiting more (%d).' % (job, attempt,))